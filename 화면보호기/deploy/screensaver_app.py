@@ -7,14 +7,28 @@ import time
 import random
 import platform
 import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import filedialog, messagebox, colorchooser
 from typing import Optional
-from PIL import Image, ImageTk
+from PIL import Image, ImageColor, ImageDraw, ImageFont, ImageTk
+
+# pic-scale(SIMD 리샘플러)가 설치되어 있으면 사용(선택 기능)
+try:
+    from pic_scale import Plan, Resampling
+except Exception:
+    Plan = None
 
 IS_WINDOWS = platform.system() == "Windows"
 CONFIG_FILE = "config.json"
 SUPPORTED_EXTS = (".png", ".jpg", ".jpeg", ".bmp", ".gif", ".tiff", ".webp")
+SUPPORTED_EXT_SET = frozenset(e[1:] for e in SUPPORTED_EXTS)  # 점 없는 확장자
+PHOTO_CACHE_SIZE = 8  # 모니터 해상도 PhotoImage 1장당 수 MB이므로 작게 유지
+RESIZE_PLAN_CACHE_SIZE = 16
+IDLE_CHECK_MAX_SECONDS = 5.0     # 유휴 감시 최대 간격
+IDLE_CHECK_ACTIVE_SECONDS = 2.0  # 화면보호기 실행 중 감시 간격
+CLOCK_FONT_SIZE = 96             # 시계 오버레이 글자 크기(px)
 
 
 # ---------------------- 기본 설정 ----------------------
@@ -59,29 +73,24 @@ if IS_WINDOWS:
     except Exception:
         pass
 
-def get_idle_seconds_windows() -> float:
-    """
-    Windows: GetLastInputInfo로 시스템 유휴 시간(초)
-    """
+    # 유휴 감시마다 호출되므로 구조체/함수 포인터는 한 번만 준비
     class LASTINPUTINFO(ctypes.Structure):
         _fields_ = [
             ("cbSize", ctypes.wintypes.UINT),
             ("dwTime", ctypes.wintypes.DWORD),
         ]
-    lii = LASTINPUTINFO()
-    lii.cbSize = ctypes.sizeof(LASTINPUTINFO)
-    if not ctypes.windll.user32.GetLastInputInfo(ctypes.byref(lii)):
-        return 0.0
-    tick_count = ctypes.windll.kernel32.GetTickCount()
-    idle_ms = tick_count - lii.dwTime
-    return idle_ms / 1000.0
 
+    GetLastInputInfo = ctypes.windll.user32.GetLastInputInfo
+    GetLastInputInfo.argtypes = [ctypes.POINTER(LASTINPUTINFO)]
+    GetLastInputInfo.restype = wintypes.BOOL
+    GetTickCount = ctypes.windll.kernel32.GetTickCount
+    GetTickCount.argtypes = []
+    GetTickCount.restype = wintypes.DWORD
 
-def enum_monitors_windows():
-    """
-    Windows: 모든 모니터 {left, top, width, height} 목록
-    """
-    monitors = []
+    last_input_info = LASTINPUTINFO()
+    last_input_info.cbSize = ctypes.sizeof(LASTINPUTINFO)
+
+    # EnumDisplayMonitors 콜백: 한 번만 만들고 강한 참조 유지(해제된 트램펄린 호출 방지)
     MonitorEnumProc = ctypes.WINFUNCTYPE(
         ctypes.wintypes.BOOL,
         ctypes.wintypes.HMONITOR,
@@ -89,31 +98,48 @@ def enum_monitors_windows():
         ctypes.POINTER(ctypes.wintypes.RECT),
         ctypes.wintypes.LPARAM
     )
+    enumerated_monitors = []
 
-    def _callback(hMonitor, hdcMonitor, lprcMonitor, dwData):
+    def _monitor_enum_callback(hMonitor, hdcMonitor, lprcMonitor, dwData):
         r = lprcMonitor.contents
         left, top = r.left, r.top
         width, height = r.right - r.left, r.bottom - r.top
-        monitors.append({"left": left, "top": top, "width": width, "height": height})
+        enumerated_monitors.append({"left": left, "top": top, "width": width, "height": height})
         return True
 
-    ctypes.windll.user32.EnumDisplayMonitors(0, 0, MonitorEnumProc(_callback), 0)
+    monitor_enum_proc = MonitorEnumProc(_monitor_enum_callback)
+    monitor_enum_lock = threading.Lock()  # enumerated_monitors 공유 보호
+
+def get_idle_seconds_windows() -> float:
+    """
+    Windows: GetLastInputInfo로 시스템 유휴 시간(초)
+    """
+    if not GetLastInputInfo(last_input_info):
+        return 0.0
+    idle_ms = GetTickCount() - last_input_info.dwTime
+    return idle_ms / 1000.0
+
+
+def enum_monitors_windows():
+    """
+    Windows: 모든 모니터 {left, top, width, height} 목록
+    """
+    with monitor_enum_lock:
+        enumerated_monitors.clear()
+        ctypes.windll.user32.EnumDisplayMonitors(0, 0, monitor_enum_proc, 0)
+        monitors = list(enumerated_monitors)
+        enumerated_monitors.clear()
     return monitors
 
 
-def get_all_monitors():
+def get_all_monitors(root: tk.Misc):
     if IS_WINDOWS:
+        # 실행할 때마다 새로 열거(모니터 배치 변경 즉시 반영). 콜백은 미리 만들어 둔 것 재사용
         mons = enum_monitors_windows()
         if mons:
             return mons
-    # Fallback: 단일 화면
-    root = tk._get_default_root()
-    if root is None:
-        temp = tk.Tk(); temp.withdraw()
-        w, h = temp.winfo_screenwidth(), temp.winfo_screenheight()
-        temp.destroy()
-    else:
-        w, h = root.winfo_screenwidth(), root.winfo_screenheight()
+    # Fallback: 단일 화면(앱의 root에서 크기만 읽음; 임시 Tk 생성 안 함)
+    w, h = root.winfo_screenwidth(), root.winfo_screenheight()
     return [{"left": 0, "top": 0, "width": w, "height": h}]
 
 
@@ -125,9 +151,36 @@ def get_idle_seconds():
 
 
 # ---------------------- 이미지 유틸 ----------------------
+# (원본 크기, 대상 크기, 모드) -> pic_scale.Plan (필터 가중치 재사용)
+resize_plans = OrderedDict()
+
+
+def lanczos_resize(img: Image.Image, size, reducing_gap: Optional[float] = None) -> Image.Image:
+    """
+    reducing_gap: 큰 축소일 때 정수배 박스 축소(reduce) 후 LANCZOS (PIL과 동일한 의미)
+    """
+    if Plan is None or img.mode not in ("RGB", "RGBA"):
+        return img.resize(size, Image.LANCZOS, reducing_gap=reducing_gap)
+    if reducing_gap is not None:
+        fx = int(img.width / size[0] / reducing_gap) or 1
+        fy = int(img.height / size[1] / reducing_gap) or 1
+        if fx > 1 or fy > 1:
+            img = img.reduce((fx, fy))
+    key = (img.size, size, img.mode)
+    plan = resize_plans.get(key)
+    if plan is None:
+        plan = Plan(img.size, size, Resampling.LANCZOS, img.mode, workers=0)
+        resize_plans[key] = plan
+        if len(resize_plans) > RESIZE_PLAN_CACHE_SIZE:
+            resize_plans.popitem(last=False)
+    else:
+        resize_plans.move_to_end(key)
+    return plan.resize(img)
+
+
 def resize_image(img: Image.Image, target_w: int, target_h: int, scale_mode: str) -> Image.Image:
     if scale_mode == "stretch":
-        return img.resize((target_w, target_h), Image.LANCZOS)
+        return lanczos_resize(img, (target_w, target_h))
 
     iw, ih = img.size
     if iw == 0 or ih == 0:
@@ -137,13 +190,13 @@ def resize_image(img: Image.Image, target_w: int, target_h: int, scale_mode: str
         # 전체가 보이도록(여백 발생 가능)
         ratio = min(target_w / iw, target_h / ih)
         nw, nh = int(iw * ratio), int(ih * ratio)
-        return img.resize((nw, nh), Image.LANCZOS)
+        return lanczos_resize(img, (nw, nh), reducing_gap=3.0)
 
     if scale_mode == "fill":
         # 화면을 꽉 채우도록(잘림 가능)
         ratio = max(target_w / iw, target_h / ih)
         nw, nh = int(iw * ratio), int(ih * ratio)
-        img2 = img.resize((nw, nh), Image.LANCZOS)
+        img2 = lanczos_resize(img, (nw, nh), reducing_gap=3.0)
         left = (nw - target_w) // 2
         top = (nh - target_h) // 2
         return img2.crop((left, top, left + target_w, top + target_h))
@@ -151,14 +204,40 @@ def resize_image(img: Image.Image, target_w: int, target_h: int, scale_mode: str
     return img
 
 
+def file_version(path: str):
+    """
+    캐시 키용 (수정 시각 ns, 크기). 같은 경로의 파일이 바뀌면 값이 달라짐
+    """
+    try:
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size
+    except OSError:
+        return None
+
+
+def load_clock_font():
+    # Windows 기본 굵은 글꼴 → 없으면 PIL 기본 글꼴
+    for name in ("segoeuib.ttf", "arialbd.ttf", "DejaVuSans-Bold.ttf"):
+        try:
+            return ImageFont.truetype(name, CLOCK_FONT_SIZE)
+        except OSError:
+            pass
+    try:
+        return ImageFont.load_default(CLOCK_FONT_SIZE)
+    except TypeError:  # Pillow < 10.1
+        return ImageFont.load_default()
+
+
 def list_images_in_folder(folder: str):
     if not os.path.isdir(folder):
         return []
+    # scandir: 디렉터리 읽기 결과의 파일 종류 정보를 재사용(파일마다 stat 호출 없음)
     files = []
-    for name in os.listdir(folder):
-        p = os.path.join(folder, name)
-        if os.path.isfile(p) and os.path.splitext(name)[1].lower() in SUPPORTED_EXTS:
-            files.append(p)
+    with os.scandir(folder) as it:
+        for e in it:
+            stem, _, ext = e.name.rpartition(".")
+            if stem and ext.lower() in SUPPORTED_EXT_SET and e.is_file():
+                files.append(e.path)
     return files
 
 
@@ -179,8 +258,20 @@ class ScreenSaverApp:
         self.slideshow_job = None
         self.idle_check_job = None
         self.clock_job = None
-        self.activated_mouse_positions = {}
+        self.activated_mouse_position = None  # 실행 시점 포인터 화면 좌표(모든 창 공통)
         self.activated_at = 0.0
+        # (경로, 파일 버전, 너비, 높이, 배치, 배경색) -> PhotoImage (LRU)
+        self.photo_cache = OrderedDict()
+        # 이미지 디코드/리사이즈 작업 스레드(Tk 메인 스레드 멈춤 방지)
+        self.io_pool = ThreadPoolExecutor(max_workers=1)
+        self.render_future = None
+        self.render_token = 0
+        self.closing = False  # 앱 종료 중: 작업 스레드 완료 콜백이 Tk를 건드리지 않도록
+        # 슬라이드 인덱스 -> (경로, 파일 버전, 배치, 배경색, 크기 목록, Future): 다음 슬라이드 미리 준비
+        self.prefetch = {}
+        self.bg_rgb = None
+        self.bg_rgb_source = None
+        self.clock_font = None
 
         # 닫기(X): 종료가 아니라 트레이/최소화로 숨기기
         self.root.protocol("WM_DELETE_WINDOW", self.on_hide_to_tray)
@@ -293,11 +384,14 @@ class ScreenSaverApp:
     # ---------------- 설정 ----------------
     def load_config(self):
         cfg = default_config()
+        self.saved_config_data = None  # 디스크에 있는 config.json 내용(같으면 저장 생략)
         if os.path.exists(CONFIG_FILE):
             try:
-                with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-                    old = json.load(f)
-                    cfg.update(old or {})
+                with open(CONFIG_FILE, "rb") as f:
+                    data = f.read()
+                self.saved_config_data = data
+                old = json.loads(data.decode("utf-8"))
+                cfg.update(old or {})
             except Exception as e:
                 print("설정 파일 로드 오류:", e)
         return cfg
@@ -321,26 +415,42 @@ class ScreenSaverApp:
             messagebox.showerror("오류", "숫자 항목(대기 시간, 슬라이드쇼 간격)을 확인하세요.")
             return
 
-        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-            json.dump(cfg, f, ensure_ascii=False, indent=2)
+        data = json.dumps(cfg, ensure_ascii=False, indent=2).encode("utf-8")
+        if data != self.saved_config_data:
+            # 임시 파일에 쓰고 교체: 쓰는 도중 종료되어도 config.json이 깨지지 않음
+            tmp = CONFIG_FILE + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, CONFIG_FILE)
+            self.saved_config_data = data
+        if (cfg["scale_mode"] != self.config.get("scale_mode")
+                or cfg["background"] != self.config.get("background")):
+            self.photo_cache.clear()
         self.config = cfg
         messagebox.showinfo("저장 완료", "설정이 저장되었습니다.")
 
     # ---------------- 유휴 감시 ----------------
-    def schedule_idle_check(self):
+    def schedule_idle_check(self, delay: float = 1.0):
         if self.idle_check_job:
             self.root.after_cancel(self.idle_check_job)
-        self.idle_check_job = self.root.after(1000, self.check_idle)
+        self.idle_check_job = self.root.after(int(delay * 1000), self.check_idle)
 
     def check_idle(self):
+        delay = IDLE_CHECK_ACTIVE_SECONDS
         try:
             if not self.saver_active:
                 idle = get_idle_seconds()
                 timeout = self.config.get("timeout_seconds", 300)
                 if timeout > 0 and idle >= timeout:
                     self.activate_screensaver(preview=False)
+                else:
+                    # 남은 유휴 시간만큼 대기(설정 변경 반영을 위해 최대 IDLE_CHECK_MAX_SECONDS)
+                    remaining = timeout - idle if timeout > 0 else IDLE_CHECK_MAX_SECONDS
+                    delay = min(max(1.0, remaining), IDLE_CHECK_MAX_SECONDS)
         finally:
-            self.schedule_idle_check()
+            self.schedule_idle_check(delay)
 
     # ---------------- 화면보호기 ----------------
     def activate_screensaver(self, preview: bool = False):
@@ -409,9 +519,13 @@ class ScreenSaverApp:
         self.saver_windows.clear()
         self.saver_labels.clear()
         self.activated_at = time.time()
-        self.activated_mouse_positions.clear()
+        # 초기 마우스 위치(화면 좌표라 창마다 구할 필요 없음)
+        try:
+            self.activated_mouse_position = self.root.winfo_pointerxy()
+        except Exception:
+            self.activated_mouse_position = None
 
-        for mon in get_all_monitors():
+        for mon in get_all_monitors(self.root):
             win = tk.Toplevel(self.root)
             win.overrideredirect(True)
             win.attributes("-topmost", True)
@@ -419,7 +533,6 @@ class ScreenSaverApp:
             win.grab_set()
             win.configure(bg=self.config.get("background", "#000000"), cursor="none")
 
-            win.bind("<Key>", self.exit_screensaver)
             win.bind("<Any-KeyPress>", self.exit_screensaver)
             win.bind("<Any-ButtonPress>", self.exit_screensaver)
             win.bind("<Motion>", self.on_mouse_motion)
@@ -431,11 +544,6 @@ class ScreenSaverApp:
                     pass
             geom = f"{mon['width']}x{mon['height']}+{mon['left']}+{mon['top']}"
             win.geometry(geom)
-            win.configure(bg=self.config.get("background", "#000000"))
-
-            win.bind("<Any-KeyPress>", self.exit_screensaver)
-            win.bind("<Any-ButtonPress>", self.exit_screensaver)
-            win.bind("<Motion>", self.on_mouse_motion)
 
             label = tk.Label(win, bg=self.config.get("background", "#000000"))
             label.pack(fill="both", expand=True)
@@ -443,14 +551,6 @@ class ScreenSaverApp:
             # 중앙 정렬(시계 오버레이 대비)
             label.configure(anchor="center", justify="center")
 
-            # 초기 마우스 위치
-            try:
-                x = win.winfo_pointerx()
-                y = win.winfo_pointery()
-                self.activated_mouse_positions[win] = (x, y)
-            except Exception:
-                self.activated_mouse_positions[win] = None
-
             self.saver_windows.append(win)
             self.saver_labels.append((label, mon))
 
@@ -468,6 +568,29 @@ class ScreenSaverApp:
             self.root.after_cancel(self.slideshow_job)
         interval_ms = max(1, int(self.config.get("slideshow_interval", 10))) * 1000
         self.slideshow_job = self.root.after(interval_ms, self.next_slide)
+        # 대기 시간 동안 다음 슬라이드를 미리 디코드/리사이즈
+        self.prefetch_slide((self.slideshow_index + 1) % len(self.current_images))
+
+    def prefetch_slide(self, index: int):
+        path = self.current_images[index]
+        if path is None or index in self.prefetch:
+            return
+        bg = self.config.get("background", "#000000")
+        scale_mode = self.config.get("scale_mode", "fit")
+        version = file_version(path)
+
+        sizes = []
+        for label, mon in self.saver_labels:
+            W, H = mon["width"], mon["height"]
+            key = (path, version, W, H, scale_mode, bg)
+            if key in self.photo_cache:
+                self.photo_cache.move_to_end(key)  # 다음 슬라이드 전에 밀려나지 않도록
+            elif (W, H) not in sizes:
+                sizes.append((W, H))
+        if not sizes:
+            return
+        future = self.io_pool.submit(self.render_frames, path, sizes, scale_mode, self.background_rgb())
+        self.prefetch[index] = (path, version, scale_mode, bg, sizes, future)
 
     def next_slide(self):
         if not self.saver_active:
@@ -477,9 +600,25 @@ class ScreenSaverApp:
         if len(self.current_images) > 1:
             self.schedule_slideshow()
 
-    def open_image_safe(self, path: str) -> Optional[Image.Image]:
+    def background_rgb(self):
+        """
+        배경색 문자열(#RRGGBB)을 (r, g, b)로 변환해 캐시. 설정이 바뀌면 다시 변환
+        """
+        bg = self.config.get("background", "#000000")
+        if bg != self.bg_rgb_source:
+            try:
+                self.bg_rgb = ImageColor.getrgb(bg)[:3]
+            except ValueError:
+                self.bg_rgb = (0, 0, 0)
+            self.bg_rgb_source = bg
+        return self.bg_rgb
+
+    def open_image_safe(self, path: str, draft_size=None) -> Optional[Image.Image]:
         try:
             img = Image.open(path)
+            if draft_size:
+                # JPEG: 디코더 단계에서 1/2~1/8 축소(Image.thumbnail과 같은 방식), 그 외 형식은 무시됨
+                img.draft(None, draft_size)
             if getattr(img, "is_animated", False):
                 img = img.convert("RGBA")
             else:
@@ -497,36 +636,118 @@ class ScreenSaverApp:
         bg = self.config.get("background", "#000000")
         scale_mode = self.config.get("scale_mode", "fit")
 
+        # 진행 중인 이전 슬라이드 작업 결과는 무시(시작 전이면 취소)
+        self.render_token += 1
+        if self.render_future:
+            self.render_future.cancel()
+
         # 배경만 표시(이미지 없음)
         if self.background_only or path is None:
-            for label, mon in self.saver_labels:
-                label.configure(image="", text="", bg=bg)
-                label.image = None
-            return
-
-        base_img = self.open_image_safe(path)
-        if base_img is None:
-            for label, mon in self.saver_labels:
-                label.configure(image="", text="", bg=bg)
-                label.image = None
+            self.clear_saver_labels(bg)
             return
 
+        version = file_version(path)  # 같은 경로에 덮어쓴 이미지는 캐시 미스
+        misses = []
         for label, mon in self.saver_labels:
             W, H = mon["width"], mon["height"]
+            key = (path, version, W, H, scale_mode, bg)
+            photo = self.photo_cache.get(key)
+            if photo is not None:
+                self.photo_cache.move_to_end(key)
+                label.configure(image=photo, text="", bg=bg)
+                label.image = photo  # 참조 유지
+            else:
+                misses.append((label, W, H))
+        if not misses:
+            return
+
+        # 디코드/리사이즈는 작업 스레드에서, PhotoImage 생성은 메인 스레드에서
+        token = self.render_token
+        # 해상도가 같은 모니터는 한 번만 리사이즈하고 PhotoImage를 공유
+        sizes = list(dict.fromkeys((W, H) for label, W, H in misses))
+        prefetched = self.prefetch.pop(self.slideshow_index, None)
+        if (prefetched and prefetched[:4] == (path, version, scale_mode, bg)
+                and set(sizes) <= set(prefetched[4])):
+            sizes, future = prefetched[4], prefetched[5]
+        else:
+            if prefetched:
+                prefetched[5].cancel()
+            future = self.io_pool.submit(self.render_frames, path, sizes, scale_mode, self.background_rgb())
+        self.render_future = future
+
+        if future.done():
+            # 미리 준비된 슬라이드: PhotoImage 생성만 하면 됨
+            self.apply_frames(token, path, version, scale_mode, bg, misses, sizes, future)
+        else:
+            future.add_done_callback(
+                lambda f: self.post_apply_frames(token, path, version, scale_mode, bg, misses, sizes, f))
+
+    def render_frames(self, path: str, sizes, scale_mode: str, bg_rgb):
+        """
+        작업 스레드에서 실행: PIL 작업만 수행(Tk 호출 금지). 실패 시 None
+        """
+        # reducing_gap=3.0과 같은 기준: 결과 크기의 3배 이상은 유지
+        draft_size = (max(W for W, H in sizes) * 3, max(H for W, H in sizes) * 3)
+        base_img = self.open_image_safe(path, draft_size)
+        if base_img is None:
+            return None
+        frames = []
+        for W, H in sizes:
             if scale_mode == "fit":
                 resized = resize_image(base_img, W, H, "fit")
-                canvas = Image.new("RGB", (W, H), bg)
-                x = (W - resized.width) // 2
-                y = (H - resized.height) // 2
-                canvas.paste(resized, (x, y))
-                final = canvas
+                if resized.size == (W, H):
+                    final = resized  # 화면 비율과 같아 여백 없음: 배경 합성 생략
+                else:
+                    canvas = Image.new("RGB", (W, H), bg_rgb)
+                    x = (W - resized.width) // 2
+                    y = (H - resized.height) // 2
+                    canvas.paste(resized, (x, y))
+                    final = canvas
             else:
                 final = resize_image(base_img, W, H, scale_mode)
+            frames.append(final)
+        return frames
+
+    def post_apply_frames(self, token, path, version, scale_mode, bg, misses, sizes, future):
+        """
+        작업 스레드에서 호출: 결과 적용을 Tk 메인 스레드로 넘김(종료 중/지난 작업은 버림)
+        """
+        if self.closing or not self.saver_active or token != self.render_token:
+            return
+        try:
+            self.root.after(0, self.apply_frames, token, path, version, scale_mode, bg, misses, sizes, future)
+        except (RuntimeError, tk.TclError):
+            pass  # root가 이미 파괴됨
 
+    def apply_frames(self, token, path, version, scale_mode, bg, misses, sizes, future):
+        if future.cancelled() or not self.saver_active or token != self.render_token:
+            return  # 화면보호기 종료 또는 다음 슬라이드로 넘어감
+        try:
+            frames = future.result()
+        except Exception as e:
+            print(f"이미지 처리 실패: {path} -> {e}")
+            frames = None
+        if frames is None:
+            self.clear_saver_labels(bg)
+            return
+
+        photos = {}
+        for (W, H), final in zip(sizes, frames):
             photo = ImageTk.PhotoImage(final)
+            photos[(W, H)] = photo
+            self.photo_cache[(path, version, W, H, scale_mode, bg)] = photo
+            if len(self.photo_cache) > PHOTO_CACHE_SIZE:
+                self.photo_cache.popitem(last=False)
+        for label, W, H in misses:
+            photo = photos[(W, H)]
             label.configure(image=photo, text="", bg=bg)
             label.image = photo  # 참조 유지
 
+    def clear_saver_labels(self, bg: str):
+        for label, mon in self.saver_labels:
+            label.configure(image="", text="", bg=bg)
+            label.image = None
+
     # ---------------- 시계 오버레이 ----------------
     def schedule_clock_overlay(self):
         if self.clock_job:
@@ -536,18 +757,26 @@ class ScreenSaverApp:
     def update_clock_overlay(self):
         if not self.saver_active or not (self.background_only and self.config.get("clock_overlay", False)):
             return
-        bg = self.config.get("background", "#000000")
-        now = time.strftime("%H:%M:%S")
-        # 큰 폰트(환경에 따라 없을 수 있어 try/except)
-        try:
-            font = ("Segoe UI", 48, "bold")
-        except Exception:
-            font = ("Arial", 48, "bold")
-
+        photo = self.render_clock(time.strftime("%H:%M:%S"))
         for label, mon in self.saver_labels:
-            label.configure(text=now, fg="#FFFFFF", bg=bg, font=font)
+            label.configure(image=photo)
+            label.image = photo  # 참조 유지
         self.schedule_clock_overlay()
 
+    def render_clock(self, text: str):
+        """
+        시계 문자열을 PIL로 그려 PhotoImage로 반환(Tk 글꼴 렌더링 대신)
+        """
+        if self.clock_font is None:
+            self.clock_font = load_clock_font()
+        # 자릿수가 바뀌어도 크기가 흔들리지 않도록 고정 폭 기준으로 캔버스 크기 결정
+        left, top, right, bottom = self.clock_font.getbbox("00:00:00")
+        w, h = right - left + 16, bottom - top + 16
+        img = Image.new("RGB", (w, h), self.background_rgb())
+        ImageDraw.Draw(img).text((w // 2, h // 2), text, font=self.clock_font,
+                                 fill=(255, 255, 255), anchor="mm")
+        return ImageTk.PhotoImage(img)
+
     # ---------------- 이벤트/종료 ----------------
     def on_mouse_motion(self, event):
         if not self.saver_active:
@@ -556,13 +785,9 @@ class ScreenSaverApp:
         if (time.time() - self.activated_at) < 0.2:
 
             return
-        win = event.widget.winfo_toplevel()
-        orig = self.activated_mouse_positions.get(win)
+        orig = self.activated_mouse_position
         if not orig:
-            try:
-                self.activated_mouse_positions[win] = (event.x_root, event.y_root)
-            except Exception:
-                pass
+            self.activated_mouse_position = (event.x_root, event.y_root)
             return
         ox, oy = orig
         dx = abs(event.x_root - ox)
@@ -582,6 +807,16 @@ class ScreenSaverApp:
             self.root.after_cancel(self.clock_job)
             self.clock_job = None
 
+        for entry in self.prefetch.values():
+            entry[5].cancel()
+        self.prefetch.clear()
+
+        # 전체 화면 PhotoImage는 장당 수~수십 MB: 단일 이미지 모드의 현재 이미지만 남김
+        # (폴더 모드는 다음 실행 때 다시 섞이므로 재사용 가능성이 낮음)
+        keep = self.current_images[0] if self.config.get("mode") == "single" and self.current_images else None
+        for key in [k for k in self.photo_cache if keep is None or k[0] != keep]:
+            del self.photo_cache[key]
+
         for w in list(self.saver_windows):
             try:
                 if w.winfo_exists():
@@ -660,7 +895,9 @@ class ScreenSaverApp:
                     self.tray.stop()
                 except Exception:
                     pass
+            self.closing = True
             self.exit_screensaver()
+            self.io_pool.shutdown(wait=False, cancel_futures=True)
             if self.idle_check_job:
                 self.root.after_cancel(self.idle_check_job)
             if self.clock_job: